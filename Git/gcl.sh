@@ -113,7 +113,11 @@ run_native() {
         fi
     fi
 
-    python3 "$SCRIPT_DIR/gcl/gcl.py" "$@"
+    # Import gcl (rather than running gcl.py) so its cached bytecode is reused;
+    # -P keeps the current directory (the Git workdir) off the module search path
+    # while user site-packages (e.g. a 'pip install --user pygit2') still load
+    python3 -P -c 'import sys; sys.argv[0] = "gcl"; sys.path.insert(0, sys.argv.pop(1)); import gcl; gcl.entry_point()' \
+        "$SCRIPT_DIR/gcl" "$@"
 }
 
 # Run via Docker
@@ -7,17 +7,27 @@ Matches the gcl.sh TUI layout and functionality
 """
 
 import os
+import re
 import sys
+import atexit
 import subprocess
+import shutil
 import curses
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
-import argparse
-from dataclasses import dataclass
+from typing import Callable, List, Tuple, Optional, Dict, NamedTuple
+from dataclasses import dataclass, field
 import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import queue
 import time
 
+# Optional: libgit2 bindings answer read-only queries without spawning git
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 # --- Configuration: Repository Lists ---
 PUBLIC_REPOS = {
     "front-Github_profile": "git@github.com:diegonmarcos/diegonmarcos.git",
@@ -40,6 +50,13 @@ PRIVATE_REPOS = {
 }
 
 ALL_REPOS = {**PUBLIC_REPOS, **PRIVATE_REPOS}
+ALL_REPO_NAMES: Tuple[str, ...] = tuple(ALL_REPOS)
+REPOS_SORTED: Tuple[str, ...] = tuple(sorted(ALL_REPOS))
+
+DEFAULT_WORK_DIR = "/home/diego/Documents/Git"
+
+# Worker threads for per-repo git calls (I/O bound, the GIL is released while waiting)
+DEFAULT_JOBS = max(4, (os.cpu_count() or 4) * 3 // 4)
 
 # --- Color Codes (for non-curses output) ---
 class Colors:
@@ -51,6 +68,11 @@ class Colors:
     BLUE = "\033[34m"
     CYAN = "\033[36m"
 
+# Piped output (files, CI logs) gets plain text instead of escape codes
+if not sys.stdout.isatty():
+    for _name in ('RESET', 'BOLD', 'RED', 'GREEN', 'YELLOW', 'BLUE', 'CYAN'):
+        setattr(Colors, _name, '')
+
 # --- Helper Functions ---
 def log(msg: str):
     """Print log message"""
@@ -68,84 +90,561 @@ def warn(msg: str):
     """Print warning message"""
     print(f"{Colors.YELLOW}  ⚠ {msg}{Colors.RESET}")
 
+# --- Path Helpers ---
+# Directory checks are cached per epoch; bump the epoch whenever repos may
+# have been cloned or removed (user refresh, after running an action).
+_dir_epoch = 0
+
+@functools.lru_cache(maxsize=None)
+def get_repo_path(work_dir: str, repo_name: str) -> str:
+    """Return the path of repo_name inside work_dir"""
+    return os.path.join(work_dir, repo_name)
+
+@functools.lru_cache(maxsize=64)
+def _dir_exists(path: str, epoch: int) -> bool:
+    return os.path.isdir(path)
+
+def dir_exists(path: str) -> bool:
+    """Cached os.path.isdir() for the current epoch"""
+    return _dir_exists(path, _dir_epoch)
+
+def invalidate_dir_cache():
+    """Start a new epoch so directory checks hit the filesystem again"""
+    global _dir_epoch
+    _dir_epoch += 1
+
 # --- Git Helper Functions ---
-def run_git(repo_dir: str, *args, timeout=300) -> Tuple[int, str]:
-    """Run git command and return (returncode, output)"""
+# An absolute executable plus close_fds=False lets subprocess use posix_spawn()
+# instead of fork()+exec(). Python's own descriptors are non-inheritable by
+# default (PEP 446), so keeping close_fds off does not leak them into git.
+GIT_BIN = shutil.which('git') or 'git'
+SH_BIN = shutil.which('sh') or '/bin/sh'
+
+# Shares one SSH connection per host across all repos instead of a handshake per fetch/push
+SSH_MULTIPLEX_COMMAND = 'ssh -o ControlMaster=auto -o ControlPersist=60s -o ControlPath=~/.ssh/cm-%r@%h:%p'
+
+@functools.lru_cache(maxsize=None)
+def get_git_env() -> Dict[str, str]:
+    """Environment for git subprocesses (built once, on first use)"""
+    env = dict(os.environ)
+    # C locale skips git's locale setup, optional locks keep parallel status probes
+    # off index.lock, and a missing credential fails instead of waiting on a prompt
+    env.update(LC_ALL='C', GIT_OPTIONAL_LOCKS='0', GIT_TERMINAL_PROMPT='0')
+    if 'GIT_SSH_COMMAND' in env or 'GIT_SSH' in env or not os.path.isdir(os.path.expanduser('~/.ssh')):
+        return env
+    # Respect a configured core.sshCommand; the environment variable would override it
+    configured = subprocess.run([GIT_BIN, 'config', '--get', 'core.sshCommand'],
+                                capture_output=True, close_fds=False)
+    if configured.returncode != 0:
+        env['GIT_SSH_COMMAND'] = SSH_MULTIPLEX_COMMAND
+    return env
+
+@functools.lru_cache(maxsize=None)
+def get_shell_env() -> Dict[str, str]:
+    """get_git_env() plus $GIT, the resolved git binary, for run_shell() scripts"""
+    return dict(get_git_env(), GIT=GIT_BIN)
+
+def decode_output(data: bytes) -> str:
+    """Decode captured git output once; undecodable bytes (e.g. odd filenames) are replaced"""
+    return data.decode('utf-8', 'replace')
+
+# Only commands that talk to a remote get a timeout; local plumbing returns in
+# milliseconds and skips subprocess's timeout bookkeeping.
+NETWORK_TIMEOUT = 300
+
+# Network git children still running. Pool threads are joined at interpreter exit,
+# so quitting the TUI terminates these instead of waiting out NETWORK_TIMEOUT.
+_network_procs = set()
+_network_procs_lock = threading.Lock()
+_network_stopped = False
+
+# How often a wait on a network command checks for stop_network_commands(). A
+# helper git started (ssh, git-remote-https) can hold the output pipes open after
+# git itself is gone, so the wait can't rely on reaching EOF.
+NETWORK_POLL_INTERVAL = 0.25
+
+def spawn_network(argv: List[str], **kwargs) -> subprocess.Popen:
+    """Popen for a command that talks to a remote, tracked until unregister_network()"""
+    with _network_procs_lock:
+        if _network_stopped:
+            raise OSError("Cancelled, gcl is quitting")
+        proc = subprocess.Popen(argv, close_fds=False, **kwargs)
+        _network_procs.add(proc)
+    return proc
+
+def unregister_network(proc: subprocess.Popen):
+    with _network_procs_lock:
+        _network_procs.discard(proc)
+
+def communicate_network(proc: subprocess.Popen, timeout: float) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """proc.communicate(timeout) that gives up with OSError once stop_network_commands() runs"""
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                return proc.communicate(timeout=min(NETWORK_POLL_INTERVAL, max(0, deadline - time.monotonic())))
+            except subprocess.TimeoutExpired:
+                if _network_stopped:
+                    proc.kill()
+                    raise OSError("Cancelled, gcl is quitting")
+                if time.monotonic() >= deadline:
+                    proc.kill()
+                    proc.communicate()
+                    raise
+    finally:
+        unregister_network(proc)
+
+def run_network(argv: List[str], timeout: float, **kwargs) -> Tuple[int, bytes, bytes]:
+    """subprocess.run() for a network command: returns (returncode, stdout, stderr)"""
+    with spawn_network(argv, **kwargs) as proc:
+        stdout, stderr = communicate_network(proc, timeout)
+    return proc.returncode, stdout or b"", stderr or b""
+
+def stop_network_commands():
+    """Terminate running network commands and refuse new ones (used when the TUI quits)"""
+    global _network_stopped
+    with _network_procs_lock:
+        _network_stopped = True
+        procs = list(_network_procs)
+    for proc in procs:
+        proc.terminate()
+
+def run_git(repo_dir: str, *args, timeout=None, need_text: bool = True,
+            with_stderr: bool = True) -> Tuple[int, str]:
+    """Run git command and return (returncode, output)
+
+    Pass timeout=NETWORK_TIMEOUT for clone/fetch/pull/push; calls with a timeout
+    are tracked so stop_network_commands() can end them.
+    Callers that only branch on the return code pass need_text=False; git's output
+    then goes to /dev/null instead of through pipes that would only be discarded.
+    Callers that parse the output pass with_stderr=False to get stdout alone, so a
+    warning can't be mistaken for data.
+    """
+    argv = [GIT_BIN, '-C', repo_dir, *args]
+    stdout = subprocess.PIPE if need_text else subprocess.DEVNULL
+    stderr = subprocess.PIPE if need_text and with_stderr else subprocess.DEVNULL
+    try:
+        if timeout is None:
+            result = subprocess.run(argv, stdout=stdout, stderr=stderr, close_fds=False, env=get_git_env())
+            returncode, out, err = result.returncode, result.stdout, result.stderr
+        else:
+            returncode, out, err = run_network(argv, timeout, stdout=stdout, stderr=stderr, env=get_git_env())
+        if not need_text:
+            return returncode, ""
+        if not with_stderr:
+            return returncode, decode_output(out)
+        return returncode, decode_output(out + err)
+    except subprocess.TimeoutExpired:
+        return 1, "Git command timed out"
+    except Exception as e:
+        return 1, str(e)
+
+def start_git(repo_dir: str, *args, timeout=NETWORK_TIMEOUT) -> Callable[[], Tuple[int, str]]:
+    """Start a git command without waiting for it
+
+    Returns a function that waits for the command and gives (returncode, output),
+    so independent steps can overlap with it.
+    """
     try:
-        result = subprocess.run(
-            ['git', '-C', repo_dir] + list(args),
-            capture_output=True, text=True, timeout=timeout
+        proc = spawn_network(
+            [GIT_BIN, '-C', repo_dir, *args],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=get_git_env()
         )
-        return result.returncode, result.stdout + result.stderr
+    except Exception as e:
+        message = str(e)
+        return lambda: (1, message)
+
+    def finish() -> Tuple[int, str]:
+        try:
+            output, _ = communicate_network(proc, timeout)
+        except subprocess.TimeoutExpired:
+            return 1, "Git command timed out"
+        except OSError as e:
+            return 1, str(e)
+        return proc.returncode, decode_output(output)
+    return finish
+
+def run_shell(repo_dir: str, script: str, *args, timeout=NETWORK_TIMEOUT) -> Tuple[int, str]:
+    """Run a POSIX shell script inside repo_dir and return (returncode, output)
+
+    args are passed as positional parameters ($1, $2, ...) so they need no quoting.
+    Scripts call git as "$GIT" so they use GIT_BIN rather than a PATH lookup, and
+    exec their network step so stop_network_commands() signals git, not the shell.
+    The shell changes into repo_dir itself: subprocess's cwd= would rule out posix_spawn().
+    """
+    argv = [SH_BIN, '-c', f'cd -- "$0" || exit; {script}', repo_dir, *args]
+    try:
+        if timeout is None:
+            result = subprocess.run(argv, capture_output=True, close_fds=False, env=get_shell_env())
+            return result.returncode, decode_output(result.stdout + result.stderr)
+        returncode, out, err = run_network(argv, timeout, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                           env=get_shell_env())
+        return returncode, decode_output(out + err)
     except subprocess.TimeoutExpired:
         return 1, "Git command timed out"
     except Exception as e:
         return 1, str(e)
 
-def get_repo_local_status(repo_dir: str) -> str:
-    """Get local repository status (uncommitted changes, unpushed commits, and untracked files)"""
-    if not Path(repo_dir).is_dir():
-        return "Not Cloned"
+# Stage everything, commit only if something is staged, then push ($1 = message).
+# Prints the commit's output (nothing if there was nothing to commit), then a
+# COMMIT_AND_PUSH_MARK line and the push's output. A failed commit exits with
+# COMMIT_FAILED and skips the push.
+COMMIT_FAILED = 101
+COMMIT_AND_PUSH_MARK = '--- gcl: push ---'
+COMMIT_AND_PUSH_SCRIPT = ('exec 2>&1; "$GIT" add . >/dev/null; '
+                          f'"$GIT" diff --cached --quiet || "$GIT" commit -m "$1" || exit {COMMIT_FAILED}; '
+                          f'echo "{COMMIT_AND_PUSH_MARK}"; exec "$GIT" push')
+
+# Commits tracked changes (plus everything 'git add .' picks up) with message $1.
+# Exits with AUTO_COMMIT_CLEAN when the tree has nothing to commit.
+AUTO_COMMIT_CLEAN = 100
+AUTO_COMMIT_SCRIPT = (f'"$GIT" diff-index --quiet HEAD -- && exit {AUTO_COMMIT_CLEAN}; '
+                      '"$GIT" add . && "$GIT" commit -m "$1"')
+
+# A --batch-check reply for an existing object: "<object name> <type> <size>"
+_BATCH_OBJECT_RE = re.compile(r'^(?:[0-9a-f]{40}|[0-9a-f]{64}) [a-z]+ [0-9]+$')
+
+class GitBatch:
+    """Long-running 'git cat-file --batch-check' process for ref lookups in one repo
+
+    The process starts on first use and again after it exits (git dies on a fatal
+    lookup); queries and restarts share one lock, so threads never race on it.
+    """
+
+    def __init__(self, repo_dir: str):
+        self.repo_dir = repo_dir
+        self.lock = threading.Lock()
+        self.proc: Optional[subprocess.Popen] = None
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Resolve ref to an object name, or None if it does not exist or can't be looked up"""
+        with self.lock:
+            try:
+                if self.proc is None or self.proc.poll() is not None:
+                    self._close()
+                    self.proc = subprocess.Popen(
+                        [GIT_BIN, '-C', self.repo_dir, 'cat-file', '--batch-check'],
+                        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                        text=True, bufsize=1, close_fds=False, env=get_git_env()
+                    )
+                self.proc.stdin.write(f"{ref}\n")
+                self.proc.stdin.flush()
+                line = self.proc.stdout.readline()
+            except (OSError, ValueError):  # Spawn failed, or BrokenPipeError once the child exited
+                line = ""
+            if not line:
+                # The next lookup starts a fresh process
+                self._close()
+                return None
+        # Anything else ("<ref> missing", "<ref> ambiguous") is not an object name
+        line = line.rstrip('\n')
+        return line.split(' ', 1)[0] if _BATCH_OBJECT_RE.match(line) else None
+
+    def close(self):
+        with self.lock:
+            self._close()
+
+    def _close(self):
+        """Shut the process down; the caller holds self.lock"""
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        for pipe in (proc.stdin, proc.stdout):
+            try:
+                pipe.close()
+            except (OSError, ValueError):
+                pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+_git_batches: Dict[str, GitBatch] = {}
+_git_batches_lock = threading.Lock()
+
+def open_repository(repo_dir: str):
+    """Open repo_dir with pygit2, or None if pygit2 is missing or the repo can't be opened"""
+    if pygit2 is None:
+        return None
+    try:
+        return pygit2.Repository(repo_dir)
+    except (pygit2.GitError, KeyError, ValueError):
+        return None
 
-    # Check for uncommitted changes (staged and unstaged) and untracked files
-    _, porcelain_output = run_git(repo_dir, 'status', '--porcelain')
-    if porcelain_output.strip():
-        return "Uncommitted"
+def resolve_ref(repo_dir: str, ref: str, repo) -> Optional[str]:
+    """Resolve ref in-process via pygit2, else through a cached GitBatch process for repo_dir
 
-    # Check if branch tracks a remote
-    ret, _ = run_git(repo_dir, 'rev-parse', '@{u}')
-    if ret != 0:
-        return "No Remote"
+    repo is the caller's open_repository(repo_dir) result, so one probe opens the
+    repository once; None means pygit2 is unavailable and GitBatch answers.
+    """
+    if repo is not None:
+        try:
+            return str(repo.revparse_single(ref).id)
+        except (pygit2.GitError, KeyError, ValueError):
+            return None
+
+    with _git_batches_lock:
+        batch = _git_batches.get(repo_dir)
+        if batch is None:
+            batch = _git_batches[repo_dir] = GitBatch(repo_dir)
+    return batch.resolve(ref)
+
+def close_git_batches():
+    """Shut down all cached GitBatch processes"""
+    with _git_batches_lock:
+        for batch in _git_batches.values():
+            batch.close()
+        _git_batches.clear()
+
+atexit.register(close_git_batches)
+
+# repo_dir -> whether 'git status --branch' last reported an upstream. Without
+# pygit2, '@{u}' lookups skip repos without one: git dies on them, and the
+# GitBatch process would be restarted on every refresh.
+_has_upstream: Dict[str, bool] = {}
+
+def resolve_upstream(repo_dir: str, repo) -> Optional[str]:
+    """resolve_ref() for '@{u}', or None straight away if git status saw no upstream"""
+    if repo is None and not _has_upstream.get(repo_dir, True):
+        return None
+    return resolve_ref(repo_dir, '@{u}', repo)
+
+_BRANCH_AB_RE = re.compile(r'^# branch\.ab \+(\d+) -(\d+)$', re.MULTILINE)
+
+def parse_branch_status(output: str) -> Tuple[bool, Optional[Tuple[int, int]]]:
+    """Parse 'git status --porcelain=v2 --branch' output into (dirty, (ahead, behind))
+
+    (ahead, behind) is None when the branch has no upstream.
+    """
+    dirty = any(line and not line.startswith('#') for line in output.splitlines())
+    match = _BRANCH_AB_RE.search(output)
+    ahead_behind = (int(match.group(1)), int(match.group(2))) if match else None
+    return dirty, ahead_behind
+
+def count_lines(output: str) -> int:
+    """Count the lines in git output without splitting it into a list"""
+    return output.count('\n') + (1 if output and not output.endswith('\n') else 0)
+
+def head_lines(output: str, n: int) -> List[str]:
+    """First n lines of git output; only those n are split off"""
+    return [line for line in output.split('\n', n)[:n] if line]
+
+def short_status_line(entry: str) -> str:
+    """Render a 'git status --porcelain=v2' entry the way 'git status --short' would"""
+    kind = entry[:1]
+    if kind in ('?', '!'):
+        return f"{kind * 2} {entry[2:]}"
+    if kind == '2':
+        # 2 XY sub mH mI mW hH hI Xscore path<TAB>origPath
+        fields = entry.split(' ', 9)
+        path, _, orig = fields[9].partition('\t')
+        return f"{fields[1].replace('.', ' ')} {orig} -> {path}"
+    # 1 XY sub mH mI mW hH hI path / u XY sub m1 m2 m3 mW h1 h2 h3 path
+    fields = entry.split(' ', 10 if kind == 'u' else 8)
+    return f"{fields[1].replace('.', ' ')} {fields[-1]}"
+
+def pygit2_short_status_line(path: str, flags: int) -> str:
+    """Render pygit2 status flags for path the way 'git status --short' would"""
+    if flags & pygit2.GIT_STATUS_WT_NEW:
+        return f"?? {path}"
+    if flags & pygit2.GIT_STATUS_CONFLICTED:
+        return f"UU {path}"
+    index_codes = ((pygit2.GIT_STATUS_INDEX_NEW, 'A'), (pygit2.GIT_STATUS_INDEX_MODIFIED, 'M'),
+                   (pygit2.GIT_STATUS_INDEX_DELETED, 'D'), (pygit2.GIT_STATUS_INDEX_RENAMED, 'R'),
+                   (pygit2.GIT_STATUS_INDEX_TYPECHANGE, 'T'))
+    worktree_codes = ((pygit2.GIT_STATUS_WT_MODIFIED, 'M'), (pygit2.GIT_STATUS_WT_DELETED, 'D'),
+                      (pygit2.GIT_STATUS_WT_RENAMED, 'R'), (pygit2.GIT_STATUS_WT_TYPECHANGE, 'T'))
+    x = next((code for flag, code in index_codes if flags & flag), ' ')
+    y = next((code for flag, code in worktree_codes if flags & flag), ' ')
+    return f"{x}{y} {path}"
+
+def get_changed_entries(repo_dir: str) -> Tuple[List[str], Optional[Tuple[int, int]]]:
+    """Return ('git status --short' lines, (ahead, behind) or None without an upstream)"""
+    repo = open_repository(repo_dir)
+    if repo is not None:
+        # libgit2 computes the status in-process instead of spawning git; an index it
+        # can't read (corrupt, locked, unsupported extension) falls back to git below
+        try:
+            changes = [pygit2_short_status_line(path, flags)
+                       for path, flags in repo.status(untracked_files='normal').items()
+                       if not flags & pygit2.GIT_STATUS_IGNORED]
+        except pygit2.GitError:
+            pass
+        else:
+            return changes, get_ahead_behind(repo_dir, repo)
+
+    # One call reports changed/untracked entries and the ahead count
+    _, status_output = run_git(repo_dir, 'status', '--porcelain=v2', '--branch', with_stderr=False)
+    _, counts = parse_branch_status(status_output)
+    _has_upstream[repo_dir] = counts is not None
+    changes = [short_status_line(line) for line in status_output.splitlines() if not line.startswith('#')]
+    return changes, counts
+
+def list_untracked_files(repo_dir: str, limit: int) -> Tuple[int, List[str]]:
+    """Return (number of untracked files, the first limit of them)"""
+    repo = open_repository(repo_dir)
+    if repo is not None:
+        try:
+            untracked = [path for path, flags in repo.status(untracked_files='all').items()
+                         if flags & pygit2.GIT_STATUS_WT_NEW]
+        except pygit2.GitError:
+            pass  # Same fallback as get_changed_entries()
+        else:
+            return len(untracked), untracked[:limit]
+
+    _, output = run_git(repo_dir, 'ls-files', '--others', '--exclude-standard', with_stderr=False)
+    if not output.strip():
+        return 0, []
+    return count_lines(output), head_lines(output, limit)
+
+class StatusCell(NamedTuple):
+    """A repo status: kind picks the color, text is what gets displayed"""
+    kind: str
+    text: str
+
+def status_cell(kind: str, count: Optional[int] = None) -> StatusCell:
+    """Build a StatusCell, prefixing the commit count for kinds like 'Unpushed'"""
+    return StatusCell(kind, kind if count is None else f"{count} {kind}")
+
+NOT_CHECKED = status_cell("Not Checked")
+CHECK_FAILED = status_cell("Check Failed")
 
-    # Check for unpushed commits
-    ret, unpushed_out = run_git(repo_dir, 'log', '@{u}..', '--oneline')
-    unpushed = len(unpushed_out.strip().split('\n')) if unpushed_out.strip() else 0
+def status_result(future) -> StatusCell:
+    """The StatusCell a finished status future produced, or CHECK_FAILED if the probe raised"""
+    try:
+        return future.result()
+    except Exception:
+        return CHECK_FAILED
+
+def get_repo_local_status(repo_dir: str) -> StatusCell:
+    """Get local repository status (uncommitted changes, unpushed commits, and untracked files)"""
+    if not dir_exists(repo_dir):
+        return status_cell("Not Cloned")
+
+    repo = open_repository(repo_dir)
+    dirty = None
+    if repo is not None:
+        # libgit2 answers in-process; ignored entries don't make the tree dirty
+        try:
+            dirty = any(not flags & pygit2.GIT_STATUS_IGNORED
+                        for flags in repo.status(untracked_files='normal').values())
+        except pygit2.GitError:
+            pass  # Unreadable index: let git report it, as get_changed_entries() does
+        else:
+            ahead_behind = None if dirty else get_ahead_behind(repo_dir, repo)
+    if dirty is None:
+        # One call reports dirty/untracked entries, upstream tracking and ahead count
+        _, status_output = run_git(repo_dir, 'status', '--porcelain=v2', '--branch', with_stderr=False)
+        dirty, ahead_behind = parse_branch_status(status_output)
+        _has_upstream[repo_dir] = ahead_behind is not None
+    if dirty:
+        return status_cell("Uncommitted")
+
+    if ahead_behind is None:
+        return status_cell("No Remote")
+
+    unpushed = ahead_behind[0]
     if unpushed > 0:
-        return f"{unpushed} Unpushed"
+        return status_cell("Unpushed", unpushed)
+
+    return status_cell("OK")
+
+# repo_dir -> (HEAD sha, upstream sha, (ahead, behind)); counts only change with the SHAs
+_ahead_behind_cache: Dict[str, Tuple[str, str, Tuple[int, int]]] = {}
+
+def get_ahead_behind(repo_dir: str, repo) -> Optional[Tuple[int, int]]:
+    """Return (ahead, behind) commit counts against the upstream, or None without one
 
-    return "OK"
+    repo is open_repository(repo_dir), opened once by the caller (None without pygit2).
+    """
+    head = resolve_ref(repo_dir, 'HEAD', repo)
+    upstream = resolve_upstream(repo_dir, repo)
+    if head is None or upstream is None:
+        return None
+
+    cached = _ahead_behind_cache.get(repo_dir)
+    if cached and cached[0] == head and cached[1] == upstream:
+        return cached[2]
+
+    if repo is not None:
+        counts = repo.ahead_behind(head, upstream)
+    else:
+        ret, output = run_git(repo_dir, 'rev-list', '--left-right', '--count', f'{head}...{upstream}',
+                              with_stderr=False)
+        if ret != 0:
+            return None
+        ahead, behind = output.split()[:2]
+        counts = (int(ahead), int(behind))
+    _ahead_behind_cache[repo_dir] = (head, upstream, counts)
+    return counts
+
+# Seconds a successful fetch stays fresh before status refreshes fetch again
+FETCH_TTL = 60.0
+
+def last_fetch_time(repo_dir: str) -> Optional[float]:
+    """Return when repo_dir was last fetched successfully (by anything), from .git/FETCH_HEAD
+
+    Every fetch rewrites FETCH_HEAD, and a failed one leaves it empty, so this also
+    sees fetches from earlier gcl runs or the shell.
+    """
+    try:
+        st = os.stat(os.path.join(repo_dir, '.git', 'FETCH_HEAD'))
+    except OSError:
+        return None
+    return st.st_mtime if st.st_size else None
+
+def fetch_repo(repo_dir: str, force: bool = False) -> bool:
+    """Fetch repo_dir quietly unless it was fetched within FETCH_TTL; return success"""
+    last = last_fetch_time(repo_dir)
+    if not force and last is not None and time.time() - last < FETCH_TTL:
+        return True
+    # Status only compares branches, so skip downloading tags
+    ret, _ = run_git(repo_dir, 'fetch', '--quiet', '--no-tags', timeout=NETWORK_TIMEOUT, need_text=False)
+    return ret == 0
 
-def get_repo_remote_status(repo_dir: str, do_fetch: bool = True) -> str:
+def get_repo_remote_status(repo_dir: str, do_fetch: bool = True, force_fetch: bool = False) -> StatusCell:
     """Get remote repository status (unpulled commits after fetch)"""
-    if not Path(repo_dir).is_dir():
-        return "Not Cloned"
+    if not dir_exists(repo_dir):
+        return status_cell("Not Cloned")
+
+    # Opened once for every lookup below; libgit2 re-reads refs, so it sees the fetch
+    repo = open_repository(repo_dir)
 
     # Check if branch tracks a remote
-    ret, _ = run_git(repo_dir, 'rev-parse', '@{u}')
-    if ret != 0:
-        return "No Remote"
+    if resolve_upstream(repo_dir, repo) is None:
+        return status_cell("No Remote")
 
-    # Fetch from remote only if requested
-    if do_fetch:
-        ret, _ = run_git(repo_dir, 'fetch', '--quiet')
-        if ret != 0:
-            return "Fetch Failed"
+    # Fetch from remote only if requested (and not fetched recently)
+    if do_fetch and not fetch_repo(repo_dir, force=force_fetch):
+        return status_cell("Fetch Failed")
 
     # Check for unpulled commits
-    ret, unpulled_out = run_git(repo_dir, 'log', 'HEAD..@{u}', '--oneline')
-    unpulled = len(unpulled_out.strip().split('\n')) if unpulled_out.strip() else 0
+    counts = get_ahead_behind(repo_dir, repo)
+    unpulled = counts[1] if counts else 0
     if unpulled > 0:
-        return f"{unpulled} To Pull"
+        return status_cell("To Pull", unpulled)
 
-    return "Up to Date"
+    return status_cell("Up to Date")
 
 def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_dir: str) -> List[str]:
     """Process a repository with given action, return list of log messages"""
     logs = []
     logs.append(f"==> Processing '{repo_dir}'")
 
-    repo_path = str(Path(work_dir) / repo_dir)
+    repo_path = get_repo_path(work_dir, repo_dir)
 
     # Read-only actions should not clone
     read_only_actions = ['status', 'untracked', 'ignored']
 
-    if not Path(repo_path).is_dir():
+    if not dir_exists(repo_path):
         if action in read_only_actions:
             logs.append(f"  ⚠ Repository not cloned yet")
             return logs
         else:
             logs.append(f"  Cloning '{repo_dir}'...")
-            ret, output = run_git(work_dir, 'clone', repo_url, repo_dir)
+            ret, output = run_git(work_dir, 'clone', repo_url, repo_dir, timeout=NETWORK_TIMEOUT)
+            invalidate_dir_cache()
             if output.strip():
                 for line in output.strip().split('\n'):
                     logs.append(f"    {line}")
@@ -156,12 +655,14 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
             return logs
 
     if action == 'sync':
-        # Commit uncommitted changes
-        ret, _ = run_git(repo_path, 'diff-index', '--quiet', 'HEAD', '--')
-        if ret != 0:
+        # The fetch only touches remote-tracking refs, so start it now and
+        # let the network round trip overlap the local auto-commit
+        finish_fetch = start_git(repo_path, 'fetch')
+
+        # Commit uncommitted changes (check, add and commit in one shell process)
+        ret, output = run_shell(repo_path, AUTO_COMMIT_SCRIPT, 'Auto-commit before sync', timeout=None)
+        if ret != AUTO_COMMIT_CLEAN:
             logs.append("  Found uncommitted changes, committing before sync...")
-            run_git(repo_path, 'add', '.')
-            ret, output = run_git(repo_path, 'commit', '-m', 'Auto-commit before sync')
             if output.strip():
                 for line in output.strip().split('\n'):
                     logs.append(f"    {line}")
@@ -169,11 +670,12 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
                 logs.append("  ✓ Changes committed.")
             else:
                 logs.append("  ✗ Commit failed.")
+                finish_fetch()
                 return logs
 
         # Fetch from remote
         logs.append("  Fetching latest changes from remote...")
-        ret, output = run_git(repo_path, 'fetch')
+        ret, output = finish_fetch()
         if output.strip():
             for line in output.strip().split('\n'):
                 logs.append(f"    {line}")
@@ -185,41 +687,44 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
 
         # Pull
         logs.append(f"  Pulling with strategy: {strategy}")
-        ret, output = run_git(repo_path, 'pull', '--no-rebase', f'--strategy-option={strategy}')
+        ret, output = run_git(repo_path, 'pull', '--no-rebase', f'--strategy-option={strategy}', timeout=NETWORK_TIMEOUT)
         if output.strip():
             for line in output.strip().split('\n'):
                 logs.append(f"    {line}")
         if ret == 0:
             logs.append("  ✓ Pull complete.")
 
-            # Add and commit any changes
-            run_git(repo_path, 'add', '.')
-            ret, _ = run_git(repo_path, 'diff-index', '--quiet', '--cached', 'HEAD', '--')
-            if ret != 0:
+            # Add, commit any changes and push in a single shell process
+            ret, output = run_shell(repo_path, COMMIT_AND_PUSH_SCRIPT, 'fixes')
+            commit_output, marked, push_output = output.partition(f"{COMMIT_AND_PUSH_MARK}\n")
+            if not marked and ret != COMMIT_FAILED:
+                # The script never reached the push (e.g. it could not start); report it there
+                commit_output, push_output = "", commit_output
+            if commit_output.strip() or ret == COMMIT_FAILED:
                 logs.append("  Found changes, committing with default message 'fixes'...")
-                ret, output = run_git(repo_path, 'commit', '-m', 'fixes')
-                if output.strip():
-                    for line in output.strip().split('\n'):
+                if commit_output.strip():
+                    for line in commit_output.strip().split('\n'):
                         logs.append(f"    {line}")
-                if ret == 0:
+                if ret == COMMIT_FAILED:
+                    logs.append("  ✗ Commit failed.")
+                else:
                     logs.append("  ✓ Commit complete.")
 
-            # Push
-            logs.append("  Pushing changes...")
-            ret, output = run_git(repo_path, 'push')
-            if output.strip():
-                for line in output.strip().split('\n'):
-                    logs.append(f"    {line}")
-            if ret == 0:
-                logs.append("  ✓ Push complete.")
-            else:
-                logs.append("  ✗ Push failed.")
+            if ret != COMMIT_FAILED:
+                logs.append("  Pushing changes...")
+                if push_output.strip():
+                    for line in push_output.strip().split('\n'):
+                        logs.append(f"    {line}")
+                if ret == 0:
+                    logs.append("  ✓ Push complete.")
+                else:
+                    logs.append("  ✗ Push failed.")
         else:
             logs.append(f"  ✗ Pull failed.")
 
     elif action == 'push':
-        run_git(repo_path, 'add', '.')
-        ret, _ = run_git(repo_path, 'diff-index', '--quiet', '--cached', 'HEAD', '--')
+        run_git(repo_path, 'add', '.', need_text=False)
+        ret, _ = run_git(repo_path, 'diff', '--cached', '--quiet', need_text=False)
         if ret != 0:
             logs.append("  Found changes, committing with default message 'fixes'...")
             ret, output = run_git(repo_path, 'commit', '-m', 'fixes')
@@ -230,7 +735,7 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
                 logs.append("  ✓ Commit complete.")
 
         logs.append("  Pushing changes...")
-        ret, output = run_git(repo_path, 'push')
+        ret, output = run_git(repo_path, 'push', timeout=NETWORK_TIMEOUT)
         if output.strip():
             for line in output.strip().split('\n'):
                 logs.append(f"    {line}")
@@ -240,12 +745,10 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
             logs.append("  ✗ Push failed.")
 
     elif action == 'pull':
-        # Commit uncommitted changes
-        ret, _ = run_git(repo_path, 'diff-index', '--quiet', 'HEAD', '--')
-        if ret != 0:
+        # Commit uncommitted changes (check, add and commit in one shell process)
+        ret, output = run_shell(repo_path, AUTO_COMMIT_SCRIPT, 'Auto-commit before pull', timeout=None)
+        if ret != AUTO_COMMIT_CLEAN:
             logs.append("  Found uncommitted changes, committing before pull...")
-            run_git(repo_path, 'add', '.')
-            ret, output = run_git(repo_path, 'commit', '-m', 'Auto-commit before pull')
             if output.strip():
                 for line in output.strip().split('\n'):
                     logs.append(f"    {line}")
@@ -253,7 +756,7 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
                 logs.append("  ✓ Changes committed.")
 
         logs.append(f"  Pulling with strategy: {strategy}")
-        ret, output = run_git(repo_path, 'pull', '--no-rebase', f'--strategy-option={strategy}')
+        ret, output = run_git(repo_path, 'pull', '--no-rebase', f'--strategy-option={strategy}', timeout=NETWORK_TIMEOUT)
         if output.strip():
             for line in output.strip().split('\n'):
                 logs.append(f"    {line}")
@@ -265,30 +768,25 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
     elif action == 'status':
         logs.append(f"  Checking '{repo_dir}'")
 
-        # Check for uncommitted changes and untracked files
-        _, status_output = run_git(repo_path, 'status', '--short')
-        if status_output.strip():
+        changes, counts = get_changed_entries(repo_path)
+        if changes:
             logs.append("  ⚠ Has uncommitted changes or untracked files")
-            for line in status_output.strip().split('\n')[:5]:
+            for line in changes[:5]:
                 logs.append(f"    {line}")
         else:
             logs.append("  ✓ Working tree clean")
 
         # Check for unpushed commits
-        ret, unpushed_out = run_git(repo_path, 'log', '@{u}..', '--oneline')
-        unpushed = len(unpushed_out.strip().split('\n')) if unpushed_out.strip() else 0
-        if unpushed > 0:
-            logs.append(f"  ⚠ Has {unpushed} unpushed commit(s)")
+        if counts is None:
+            logs.append("  ⚠ Branch does not track a remote")
+        elif counts[0] > 0:
+            logs.append(f"  ⚠ Has {counts[0]} unpushed commit(s)")
         else:
-            ret, _ = run_git(repo_path, 'rev-parse', '@{u}')
-            if ret == 0:
-                logs.append("  ✓ All commits pushed")
-            else:
-                logs.append("  ⚠ Branch does not track a remote")
+            logs.append("  ✓ All commits pushed")
 
     elif action == 'fetch':
         logs.append(f"  Fetching in '{repo_dir}'...")
-        ret, output = run_git(repo_path, 'fetch')
+        ret, output = run_git(repo_path, 'fetch', timeout=NETWORK_TIMEOUT)
         if output.strip():
             for line in output.strip().split('\n'):
                 logs.append(f"    {line}")
@@ -299,22 +797,21 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
 
     elif action == 'untracked':
         logs.append(f"  Checking '{repo_dir}'")
-        _, untracked_output = run_git(repo_path, 'ls-files', '--others', '--exclude-standard')
-        if untracked_output.strip():
-            untracked_files = untracked_output.strip().split('\n')
-            logs.append(f"  ⚠ Has {len(untracked_files)} untracked file(s)")
-            for f in untracked_files[:10]:
+        count, preview = list_untracked_files(repo_path, 10)
+        if count:
+            logs.append(f"  ⚠ Has {count} untracked file(s)")
+            for f in preview:
                 logs.append(f"    {f}")
         else:
             logs.append("  ✓ No untracked files")
 
     elif action == 'ignored':
         logs.append(f"  Checking '{repo_dir}'")
-        _, ignored_output = run_git(repo_path, 'ls-files', '--others', '--ignored', '--exclude-standard')
+        _, ignored_output = run_git(repo_path, 'ls-files', '--others', '--ignored', '--exclude-standard',
+                                    with_stderr=False)
         if ignored_output.strip():
-            ignored_files = ignored_output.strip().split('\n')
-            logs.append(f"  ⚠ Has {len(ignored_files)} ignored file(s)")
-            for f in ignored_files[:10]:
+            logs.append(f"  ⚠ Has {count_lines(ignored_output)} ignored file(s)")
+            for f in head_lines(ignored_output, 10):
                 logs.append(f"    {f}")
         else:
             logs.append("  ✓ No ignored files")
@@ -323,16 +820,56 @@ def process_repo(repo_dir: str, repo_url: str, strategy: str, action: str, work_
 
 # --- TUI Implementation ---
 
+# Color pair per StatusCell.kind; kinds not listed draw plain
+LOCAL_STATUS_COLORS = {
+    "OK": 3,
+    "Not Cloned": 4,
+    "Uncommitted": 4,
+    "Unpushed": 4,
+    "No Remote": 4,
+    "Check Failed": 4,
+}
+
+REMOTE_STATUS_COLORS = {
+    "Up to Date": 3,
+    "Not Cloned": 4,
+    "To Pull": 4,
+    "Fetch Failed": 4,
+    "Check Failed": 4,
+    "Not Checked": 5,
+}
+
+# ACTION field lines, in action_selected order; the name is pre-split around its
+# shortcut letter so draw() needn't search for it. None is a blank line.
+ACTION_ROWS = [
+    (action_idx, *name.partition(shortcut), description) if name else None
+    for action_idx, name, shortcut, description in [
+        (0, "SYNC", "S", "(Add/Commit, Fetch, Pull, Add/Commit, Push)"),
+        (1, "FETCH", "F", "(Get from Remote)"),
+        (2, "PULL", "L", "(Merge from Remote)"),
+        (3, "PUSH", "P", "(Merge from Local)"),
+        (None, None, None, None),
+        (4, "STATUS", "T", "(Check Local Untracked and Uncommitted)"),
+        (5, "UNTRACKED", "N", "(List untracked files)"),
+        (6, "IGNORED", "I", "(List ignored files)"),
+    ]
+]
+
+@dataclass
+class RepoView:
+    """One line of the TUI repository list"""
+    name: str
+    selected: bool = True
+    local: StatusCell = NOT_CHECKED
+    remote: StatusCell = NOT_CHECKED
+
 class TUI:
     def __init__(self, stdscr):
         self.stdscr = stdscr
         self.running = True
 
         # State variables
-        self.repos = sorted(ALL_REPOS.keys())
-        self.repo_selection = [True] * len(self.repos)
-        self.repo_local_status = ["Not Checked"] * len(self.repos)
-        self.repo_remote_status = ["Not Checked"] * len(self.repos)
+        self.repo_views = [RepoView(name) for name in REPOS_SORTED]
 
         self.workdir_selected = 1  # 0=current dir, 1=custom path
         self.workdir_path = "/home/diego/Documents/Git"
@@ -343,9 +880,23 @@ class TUI:
         self.current_field = 0  # 0=workdir, 1=strategy, 2=action, 3=repos, 4=run
         self.total_fields = 5
         self.status_message = ""  # For showing refresh status
+        self.needs_redraw = True  # Set by handle_input when the screen is stale
+        # Reused by every refresh; workers only run git, all drawing stays on the curses thread
+        self.pool = ThreadPoolExecutor(max_workers=DEFAULT_JOBS)
+        # Startup remote refresh that runs while the menu accepts input; it has its own
+        # workers so a local refresh isn't queued behind fetches that are still running
+        self.background_pool = ThreadPoolExecutor(max_workers=DEFAULT_JOBS)
+        self.background_futures = []
+        self.background_generation = 0
+        self.background_pending = 0
+        self.background_rows = set()  # Repo rows with new results, repainted by run()
+        self.background_lock = threading.Lock()
 
         # Initialize curses
         curses.curs_set(0)
+        self.stdscr.leaveok(True)  # Cursor is hidden; don't move it after updates
+        self.stdscr.timeout(250)  # getch() wakes up to show background results
+        curses.def_prog_mode()  # Saved so execute_action() can resume without a new initscr()
         if curses.has_colors():
             curses.start_color()
             curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
@@ -356,255 +907,277 @@ class TUI:
             curses.init_pair(6, curses.COLOR_BLACK, curses.COLOR_CYAN)  # Highlight
             curses.init_pair(7, curses.COLOR_BLACK, curses.COLOR_GREEN)  # Run button
 
-        # Do a quick local status scan on startup
-        self.status_message = "Loading repository statuses..."
-        self.draw()  # Show loading message
+        # Attributes used by draw(), combined once instead of on every repaint
+        self.attr_title = curses.color_pair(1) | curses.A_BOLD
+        self.attr_header = curses.color_pair(2) | curses.A_BOLD
+        self.attr_rule = curses.color_pair(2)
+        self.attr_key = curses.color_pair(5) | curses.A_BOLD
+        self.attr_highlight = curses.color_pair(6)
+        self.attr_run = curses.color_pair(7) | curses.A_BOLD
+        self.local_status_attrs = {kind: curses.color_pair(pair) for kind, pair in LOCAL_STATUS_COLORS.items()}
+        self.remote_status_attrs = {kind: curses.color_pair(pair) for kind, pair in REMOTE_STATUS_COLORS.items()}
+
+        # Do a quick local status scan on startup (it draws the first frame)
         self.refresh_local_status()
 
-    def refresh_local_status(self):
-        """Refresh local repository status (fast, no remote fetch)"""
+        # Fetch remote status in the background; rows fill in as fetches return
+        self.start_background_remote_refresh()
+
+    def start_background_remote_refresh(self):
+        """Queue a remote status check for every repo without blocking the menu"""
         work_dir = "." if self.workdir_selected == 0 else self.workdir_path
-        if not Path(work_dir).is_dir():
+        if not dir_exists(work_dir):
             return
 
-        for i, repo in enumerate(self.repos):
-            self.status_message = f"Refreshing local status... ({i+1}/{len(self.repos)})"
-            self.draw()  # Update display during refresh
-            repo_path = str(Path(work_dir) / repo)
-            self.repo_local_status[i] = get_repo_local_status(repo_path)
-
-        self.status_message = ""
+        self.background_pending = len(self.repo_views)
+        self.status_message = f"Fetching remote status... (0/{len(self.repo_views)})"
+        generation = self.background_generation
+        self.background_futures = []
+        for i, view in enumerate(self.repo_views):
+            future = self.background_pool.submit(get_repo_remote_status, get_repo_path(work_dir, view.name))
+            future.add_done_callback(functools.partial(self._background_done, generation, i))
+            self.background_futures.append(future)
+
+    def _background_done(self, generation: int, repo_idx: int, future):
+        """Runs on a worker thread: store one result and let run() repaint"""
+        with self.background_lock:
+            if generation != self.background_generation:
+                return  # Superseded by stop_background_refresh()
+            if not future.cancelled():
+                # A raising probe must still count as done, or the progress line never clears
+                self.repo_views[repo_idx].remote = status_result(future)
+                self.background_rows.add(repo_idx)
+            self.background_pending -= 1
+            done = len(self.repo_views) - self.background_pending
+            self.status_message = (f"Fetching remote status... ({done}/{len(self.repo_views)})"
+                                   if self.background_pending else "")
+            self.background_rows.add(None)  # None = the status message line
+
+    def stop_background_refresh(self, wait_running: bool = True):
+        """Cancel queued background checks and, unless wait_running is False, wait for
+        running ones (before fetching or running actions on the same repos)"""
+        with self.background_lock:
+            if not self.background_futures:
+                return
+            self.background_generation += 1
+            futures, self.background_futures = self.background_futures, []
+            self.status_message = ""
+        for future in futures:
+            future.cancel()
+        running = [future for future in futures if not future.done()]
+        if not wait_running:
+            self.background_futures = running  # A later fetch or action still waits for these
+            return
+        if running:
+            # A fetch can take up to NETWORK_TIMEOUT; say why the menu stopped responding
+            self.status_message = "Waiting for background fetches..."
+            self.repaint_repo_rows(status_message=True)
+            wait(running)
+            self.status_message = ""
 
-    def refresh_remote_status(self):
-        """Refresh remote repository status (slow, does fetch)"""
+    def refresh_local_status(self):
+        """Refresh local repository status (fast, no remote fetch)"""
+        # Read-only (GIT_OPTIONAL_LOCKS=0), so it can run next to background fetches
+        self._refresh_statuses(get_repo_local_status, 'local', "Refreshing local status",
+                               wait_background=False)
+
+    def refresh_remote_status(self, force_fetch: bool = False):
+        """Refresh remote repository status (slow, does fetch unless fetched recently)"""
+        status_fn = functools.partial(get_repo_remote_status, force_fetch=force_fetch)
+        self._refresh_statuses(status_fn, 'remote', "Fetching remote status")
+
+    def _refresh_statuses(self, status_fn, column: str, label: str, wait_background: bool = True):
+        """Run status_fn for every repo on a worker pool, storing results into the
+        RepoView attribute named column ('local' or 'remote') as they complete"""
         work_dir = "." if self.workdir_selected == 0 else self.workdir_path
-        if not Path(work_dir).is_dir():
+        if not dir_exists(work_dir):
             return
 
-        for i, repo in enumerate(self.repos):
-            self.status_message = f"Fetching remote status... ({i+1}/{len(self.repos)})"
-            self.draw()  # Update display during refresh
-            repo_path = str(Path(work_dir) / repo)
-            self.repo_remote_status[i] = get_repo_remote_status(repo_path)
+        # Don't run a second fetch against the same repo as a background check
+        self.stop_background_refresh(wait_running=wait_background)
+
+        # One full draw shows the key's other effects; progress then repaints only what changes
+        self.status_message = f"{label}... (0/{len(self.repo_views)})"
+        self.draw()
+
+        futures = {}
+        try:
+            futures = {
+                self.pool.submit(status_fn, get_repo_path(work_dir, view.name)): i
+                for i, view in enumerate(self.repo_views)
+            }
+            pending = set(futures)
+            while pending:
+                # Take every result that is ready, then repaint just those rows and the progress line
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    setattr(self.repo_views[futures[future]], column, status_result(future))
+                done = len(self.repo_views) - len(pending)
+                self.status_message = f"{label}... ({done}/{len(self.repo_views)})"
+                self.repaint_repo_rows(*(futures[future] for future in finished), status_message=True)
+        finally:
+            # On Ctrl+C don't start the queued repos; only wait for running git calls
+            for future in futures:
+                future.cancel()
+            wait(futures)
 
         self.status_message = ""
 
     def draw(self):
         """Draw the entire interface"""
-        self.stdscr.clear()
+        # erase() (unlike clear()) lets curses send only the cells that changed
+        self.stdscr.erase()
         h, w = self.stdscr.getmaxyx()
 
         row = 0
 
         # Title
         title = "╔══════════════════════════════════════════╗"
-        self.stdscr.addstr(row, 2, title, curses.color_pair(1) | curses.A_BOLD)
+        self.stdscr.addstr(row, 2, title, self.attr_title)
         row += 1
-        self.stdscr.addstr(row, 2, "║ gcl.py - Git Sync Manager               ║", curses.color_pair(1) | curses.A_BOLD)
+        self.stdscr.addstr(row, 2, "║ gcl.py - Git Sync Manager               ║", self.attr_title)
         row += 1
-        self.stdscr.addstr(row, 2, "╚══════════════════════════════════════════╝", curses.color_pair(1) | curses.A_BOLD)
+        self.stdscr.addstr(row, 2, "╚══════════════════════════════════════════╝", self.attr_title)
         row += 2
 
         # Working Directory
-        self.stdscr.addstr(row, 2, "WORKING DIRECTORY:", curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.addstr(row, 2, "WORKING DIRECTORY:", self.attr_header)
         row += 1
-        self.stdscr.addstr(row, 2, "══════════════════", curses.color_pair(2))
+        self.stdscr.addstr(row, 2, "══════════════════", self.attr_rule)
         row += 1
 
         opt0 = f"[{'●' if self.workdir_selected == 0 else ' '}] Current Directory (.)"
-        attr0 = curses.color_pair(6) if self.current_field == 0 and self.workdir_selected == 0 else curses.A_NORMAL
+        attr0 = self.attr_highlight if self.current_field == 0 and self.workdir_selected == 0 else curses.A_NORMAL
         self.stdscr.addstr(row, 4, opt0, attr0)
         row += 1
 
         opt1 = f"[{'●' if self.workdir_selected == 1 else ' '}] Custom Path: {self.workdir_path}"
-        attr1 = curses.color_pair(6) if self.current_field == 0 and self.workdir_selected == 1 else curses.A_NORMAL
+        attr1 = self.attr_highlight if self.current_field == 0 and self.workdir_selected == 1 else curses.A_NORMAL
         self.stdscr.addstr(row, 4, opt1, attr1)
         row += 3
 
         # Merge Strategy
-        self.stdscr.addstr(row, 2, "MERGE STRATEGY (On Conflict):", curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.addstr(row, 2, "MERGE STRATEGY (On Conflict):", self.attr_header)
         row += 1
-        self.stdscr.addstr(row, 2, "══════════════════════════════", curses.color_pair(2))
+        self.stdscr.addstr(row, 2, "══════════════════════════════", self.attr_rule)
         row += 1
 
         # Strategy 0: LOCAL with 'O' highlighted
         marker0 = '●' if self.strategy_selected == 0 else ' '
-        attr_s0 = curses.color_pair(6) if self.current_field == 1 and self.strategy_selected == 0 else curses.A_NORMAL
+        attr_s0 = self.attr_highlight if self.current_field == 1 and self.strategy_selected == 0 else curses.A_NORMAL
         if self.current_field == 1 and self.strategy_selected == 0:
             self.stdscr.addstr(row, 4, f"[{marker0}] LOCAL  (Keep local changes)", attr_s0)
         else:
             self.stdscr.addstr(row, 4, f"[{marker0}] L")
-            self.stdscr.addstr(row, 9, "O", curses.color_pair(5) | curses.A_BOLD)
+            self.stdscr.addstr(row, 9, "O", self.attr_key)
             self.stdscr.addstr(row, 10, "CAL  (Keep local changes)")
         row += 1
 
         # Strategy 1: REMOTE with 'E' highlighted
         marker1 = '●' if self.strategy_selected == 1 else ' '
-        attr_s1 = curses.color_pair(6) if self.current_field == 1 and self.strategy_selected == 1 else curses.A_NORMAL
+        attr_s1 = self.attr_highlight if self.current_field == 1 and self.strategy_selected == 1 else curses.A_NORMAL
         if self.current_field == 1 and self.strategy_selected == 1:
             self.stdscr.addstr(row, 4, f"[{marker1}] REMOTE (Overwrite with remote)", attr_s1)
         else:
             self.stdscr.addstr(row, 4, f"[{marker1}] R")
-            self.stdscr.addstr(row, 9, "E", curses.color_pair(5) | curses.A_BOLD)
+            self.stdscr.addstr(row, 9, "E", self.attr_key)
             self.stdscr.addstr(row, 10, "MOTE (Overwrite with remote)")
         row += 3
 
         # Action
-        self.stdscr.addstr(row, 2, "ACTION:", curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.addstr(row, 2, "ACTION:", self.attr_header)
         row += 1
-        self.stdscr.addstr(row, 2, "══════", curses.color_pair(2))
+        self.stdscr.addstr(row, 2, "══════", self.attr_rule)
         row += 1
 
-        # Actions with new layout and order
-        actions_data = [
-            (0, "SYNC", "S", "(Add/Commit, Fetch, Pull, Add/Commit, Push)"),
-            (1, "FETCH", "F", "(Get from Remote)"),
-            (2, "PULL", "L", "(Merge from Remote)"),
-            (3, "PUSH", "P", "(Merge from Local)"),
-            (None, None, None, None),  # blank line
-            (4, "STATUS", "T", "(Check Local Untracked and Uncommitted)"),
-            (5, "UNTRACKED", "N", "(List untracked files)"),
-            (6, "IGNORED", "I", "(List ignored files)"),
-        ]
-
-        for action_info in actions_data:
-            if action_info[0] is None:  # blank line
+        for action_row in ACTION_ROWS:
+            if action_row is None:  # blank line
                 row += 1
                 continue
 
-            action_idx = action_info[0]
-            action_name = action_info[1]
-            shortcut = action_info[2]
-            description = action_info[3]
-
+            action_idx, before, shortcut, after, description = action_row
             marker = '●' if self.action_selected == action_idx else ' '
-            attr = curses.color_pair(6) if self.current_field == 2 and self.action_selected == action_idx else curses.A_NORMAL
 
             # If this action is currently selected, use solid highlight
             if self.current_field == 2 and self.action_selected == action_idx:
-                self.stdscr.addstr(row, 4, f"[{marker}] {action_name:<10} {description}", attr)
+                self.stdscr.addstr(row, 4, f"[{marker}] {before + shortcut + after:<10} {description}",
+                                   self.attr_highlight)
             else:
-                # Draw with highlighted shortcut letter
-                self.stdscr.addstr(row, 4, f"[{marker}] ")
-
-                # Find position of shortcut letter in action name
-                shortcut_pos = action_name.find(shortcut)
-                if shortcut_pos >= 0:
-                    # Draw text before shortcut
-                    if shortcut_pos > 0:
-                        self.stdscr.addstr(row, 8, action_name[:shortcut_pos])
-                    # Draw shortcut in bold yellow
-                    self.stdscr.addstr(row, 8 + shortcut_pos, shortcut, curses.color_pair(5) | curses.A_BOLD)
-                    # Draw text after shortcut
-                    if shortcut_pos + 1 < len(action_name):
-                        self.stdscr.addstr(row, 8 + shortcut_pos + 1, action_name[shortcut_pos + 1:])
-                    # Draw description
-                    self.stdscr.addstr(row, 8 + len(action_name) + 1, description)
-                else:
-                    self.stdscr.addstr(row, 8, f"{action_name} {description}")
+                # Draw with the shortcut letter in bold yellow
+                self.stdscr.addstr(row, 4, f"[{marker}] {before}")
+                self.stdscr.addstr(shortcut, self.attr_key)
+                self.stdscr.addstr(f"{after} {description}")
             row += 1
 
         row += 2
 
         # Repositories
         repo_start_row = row
-        self.stdscr.addstr(row, 2, "REPOSITORIES (Toggle with SPACE):", curses.color_pair(2) | curses.A_BOLD)
-        self.stdscr.addstr(row, 40, "LOCAL STATUS:", curses.color_pair(2) | curses.A_BOLD)
-        self.stdscr.addstr(row, 60, "REMOTE STATUS:", curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.addstr(row, 2, "REPOSITORIES (Toggle with SPACE):", self.attr_header)
+        self.stdscr.addstr(row, 40, "LOCAL STATUS:", self.attr_header)
+        self.stdscr.addstr(row, 60, "REMOTE STATUS:", self.attr_header)
         row += 1
-        self.stdscr.addstr(row, 2, "═════════════════════════════════", curses.color_pair(2))
-        self.stdscr.addstr(row, 40, "═════════════", curses.color_pair(2))
-        self.stdscr.addstr(row, 60, "══════════════", curses.color_pair(2))
+        self.stdscr.addstr(row, 2, "═════════════════════════════════", self.attr_rule)
+        self.stdscr.addstr(row, 40, "═════════════", self.attr_rule)
+        self.stdscr.addstr(row, 60, "══════════════", self.attr_rule)
         row += 1
 
         max_visible_repos = min(14, h - row - 10)  # Show up to 14 repos
 
-        # Display repos with scrolling support
-        for i in range(max_visible_repos):
-            repo_idx = self.repo_scroll_offset + i
-            if repo_idx >= len(self.repos):
-                break
-
-            marker = "✓" if self.repo_selection[repo_idx] else " "
-            repo_line = f"[{marker}] {self.repos[repo_idx]:<30}"
-
-            local_status = self.repo_local_status[repo_idx]
-            remote_status = self.repo_remote_status[repo_idx]
-
-            # Determine color for local status
-            local_color = curses.A_NORMAL
-            if "OK" in local_status:
-                local_color = curses.color_pair(3)
-            elif "Not Cloned" in local_status or "Uncommitted" in local_status or "Unpushed" in local_status:
-                local_color = curses.color_pair(4)
-            elif "No Remote" in local_status:
-                local_color = curses.color_pair(4)
-
-            # Determine color for remote status
-            remote_color = curses.A_NORMAL
-            if "Up to Date" in remote_status:
-                remote_color = curses.color_pair(3)
-            elif "Not Cloned" in remote_status or "To Pull" in remote_status or "Fetch Failed" in remote_status:
-                remote_color = curses.color_pair(4)
-            elif "Not Checked" in remote_status:
-                remote_color = curses.color_pair(5)
-
-            if self.current_field == 3 and repo_idx == self.repo_cursor:
-                self.stdscr.addstr(row, 4, repo_line, curses.color_pair(6))
-                self.stdscr.addstr(row, 40, f"{local_status:<18}", curses.color_pair(6))
-                self.stdscr.addstr(row, 60, remote_status, curses.color_pair(6))
-            else:
-                self.stdscr.addstr(row, 4, repo_line)
-                self.stdscr.addstr(row, 40, f"{local_status:<18}", local_color)
-                self.stdscr.addstr(row, 60, remote_status, remote_color)
+        # Display repos with scrolling support; remember where so single rows can be repainted
+        self.repo_list_row = row
+        self.visible_repo_count = max(0, min(max_visible_repos, len(self.repo_views) - self.repo_scroll_offset))
+        for i in range(self.visible_repo_count):
+            self.draw_repo_row(self.repo_scroll_offset + i)
             row += 1
 
         row += 1
 
         # RUN button
         run_text = "   [ RUN ]   "
-        run_attr = curses.color_pair(7) | curses.A_BOLD if self.current_field == 4 else curses.A_BOLD
+        run_attr = self.attr_run if self.current_field == 4 else curses.A_BOLD
         self.stdscr.addstr(row, 2, run_text, run_attr)
         row += 3
 
         # Status message (if refreshing)
+        self.status_message_row = row + 1
         if self.status_message:
             row += 1
-            self.stdscr.addstr(row, 2, self.status_message, curses.color_pair(5) | curses.A_BOLD)
+            self.stdscr.addstr(row, 2, self.status_message, self.attr_key)
             row += 1
 
         # Help text
         row = h - 8
-        self.stdscr.addstr(row, 2, "KEYBOARD SHORTCUTS", curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.addstr(row, 2, "KEYBOARD SHORTCUTS", self.attr_header)
         row += 1
-        self.stdscr.addstr(row, 2, "═══════════════════", curses.color_pair(2))
+        self.stdscr.addstr(row, 2, "═══════════════════", self.attr_rule)
         row += 1
 
         # Navigate line
         col = 2
         self.stdscr.addstr(row, col, "Navigate: (", curses.A_BOLD)
         col += 11
-        self.stdscr.addstr(row, col, "↑", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "↑", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, "/", curses.A_BOLD)
         col += 1
-        self.stdscr.addstr(row, col, "↓", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "↓", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") List | (")
         col += 10
-        self.stdscr.addstr(row, col, "TAB", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "TAB", self.attr_key)
         col += 3
         self.stdscr.addstr(row, col, ") Field | (")
         col += 11
-        self.stdscr.addstr(row, col, "SPACE", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "SPACE", self.attr_key)
         col += 5
         self.stdscr.addstr(row, col, ") Toggle | (")
         col += 12
-        self.stdscr.addstr(row, col, "ENTER", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "ENTER", self.attr_key)
         col += 5
         self.stdscr.addstr(row, col, ") Run | (")
         col += 9
-        self.stdscr.addstr(row, col, "q", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "q", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Quit")
         row += 1
@@ -613,15 +1186,15 @@ class TUI:
         col = 2
         self.stdscr.addstr(row, col, "Select:   (", curses.A_BOLD)
         col += 11
-        self.stdscr.addstr(row, col, "a", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "a", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") All | (")
         col += 9
-        self.stdscr.addstr(row, col, "u", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "u", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") None | (")
         col += 10
-        self.stdscr.addstr(row, col, "k", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "k", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Smart Select")
         row += 1
@@ -630,11 +1203,11 @@ class TUI:
         col = 2
         self.stdscr.addstr(row, col, "Strategy: (", curses.A_BOLD)
         col += 11
-        self.stdscr.addstr(row, col, "o", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "o", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Local | (")
         col += 11
-        self.stdscr.addstr(row, col, "e", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "e", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Remote")
         row += 1
@@ -643,19 +1216,19 @@ class TUI:
         col = 2
         self.stdscr.addstr(row, col, "Actions:  (", curses.A_BOLD)
         col += 11
-        self.stdscr.addstr(row, col, "s", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "s", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Sync | (")
         col += 10
-        self.stdscr.addstr(row, col, "f", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "f", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Fetch | (")
         col += 11
-        self.stdscr.addstr(row, col, "l", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "l", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Pull | (")
         col += 10
-        self.stdscr.addstr(row, col, "p", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "p", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Push")
         row += 1
@@ -664,19 +1237,63 @@ class TUI:
         col = 12
         self.stdscr.addstr(row, col, "(")
         col += 1
-        self.stdscr.addstr(row, col, "t", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "t", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Status | (")
         col += 13
-        self.stdscr.addstr(row, col, "n", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "n", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Untracked | (")
         col += 15
-        self.stdscr.addstr(row, col, "r", curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.addstr(row, col, "r", self.attr_key)
         col += 1
         self.stdscr.addstr(row, col, ") Refresh")
 
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+    def draw_repo_row(self, repo_idx: int):
+        """Draw one repository line at its position from the last full draw()"""
+        row = self.repo_list_row + repo_idx - self.repo_scroll_offset
+        view = self.repo_views[repo_idx]
+        marker = "✓" if view.selected else " "
+        repo_line = f"[{marker}] {view.name:<30}"
+
+        local_status = view.local
+        remote_status = view.remote
+
+        # Status colors are a table lookup on the status kind
+        local_color = self.local_status_attrs.get(local_status.kind, curses.A_NORMAL)
+        remote_color = self.remote_status_attrs.get(remote_status.kind, curses.A_NORMAL)
+
+        self.stdscr.move(row, 0)
+        self.stdscr.clrtoeol()
+        if self.current_field == 3 and repo_idx == self.repo_cursor:
+            self.stdscr.addstr(row, 4, repo_line, self.attr_highlight)
+            self.stdscr.addstr(row, 40, f"{local_status.text:<18}", self.attr_highlight)
+            self.stdscr.addstr(row, 60, remote_status.text, self.attr_highlight)
+        else:
+            self.stdscr.addstr(row, 4, repo_line)
+            self.stdscr.addstr(row, 40, f"{local_status.text:<18}", local_color)
+            self.stdscr.addstr(row, 60, remote_status.text, remote_color)
+
+    def draw_status_message(self):
+        """Draw (or clear) the status message line at its position from the last full draw()"""
+        self.stdscr.move(self.status_message_row, 0)
+        self.stdscr.clrtoeol()
+        if self.status_message:
+            self.stdscr.addstr(self.status_message_row, 2, self.status_message, self.attr_key)
+
+    def repaint_repo_rows(self, *repo_indices: int, status_message: bool = False):
+        """Redraw just the given repository lines (and optionally the status message)"""
+        first = self.repo_scroll_offset
+        for repo_idx in repo_indices:
+            if first <= repo_idx < first + self.visible_repo_count:
+                self.draw_repo_row(repo_idx)
+        if status_message:
+            self.draw_status_message()
+        self.stdscr.noutrefresh()
+        curses.doupdate()
 
     def handle_input(self, key):
         """Handle keyboard input"""
@@ -685,21 +1302,29 @@ class TUI:
 
         elif key == curses.KEY_UP:
             if self.current_field == 3:  # In repo list
+                old_cursor = self.repo_cursor
                 self.repo_cursor = max(0, self.repo_cursor - 1)
                 # Adjust scroll offset if cursor goes above visible area
                 if self.repo_cursor < self.repo_scroll_offset:
                     self.repo_scroll_offset = self.repo_cursor
+                elif not self.needs_redraw:
+                    self.repaint_repo_rows(old_cursor, self.repo_cursor)
+                    return  # Only the two cursor rows changed
             else:
                 self.current_field = (self.current_field - 1) % self.total_fields
 
         elif key == curses.KEY_DOWN:
             if self.current_field == 3:  # In repo list
-                self.repo_cursor = min(len(self.repos) - 1, self.repo_cursor + 1)
+                old_cursor = self.repo_cursor
+                self.repo_cursor = min(len(self.repo_views) - 1, self.repo_cursor + 1)
                 # Adjust scroll offset if cursor goes below visible area
                 h, w = self.stdscr.getmaxyx()
                 max_visible = min(14, h - 30)
                 if self.repo_cursor >= self.repo_scroll_offset + max_visible:
                     self.repo_scroll_offset = self.repo_cursor - max_visible + 1
+                elif not self.needs_redraw:
+                    self.repaint_repo_rows(old_cursor, self.repo_cursor)
+                    return  # Only the two cursor rows changed
             else:
                 self.current_field = (self.current_field + 1) % self.total_fields
 
@@ -714,30 +1339,36 @@ class TUI:
             elif self.current_field == 2:  # Cycle action
                 self.action_selected = (self.action_selected + 1) % 7
             elif self.current_field == 3:  # Toggle repo selection
-                self.repo_selection[self.repo_cursor] = not self.repo_selection[self.repo_cursor]
+                view = self.repo_views[self.repo_cursor]
+                view.selected = not view.selected
+                if not self.needs_redraw:
+                    self.repaint_repo_rows(self.repo_cursor)
+                    return
 
         elif key == ord('\n') or key == ord('\r') or key == 10 or key == 13:  # ENTER
             self.execute_action()
 
         # Shortcuts
         elif key == ord('a'):  # Select all
-            self.repo_selection = [True] * len(self.repos)
+            for view in self.repo_views:
+                view.selected = True
 
         elif key == ord('u'):  # Unselect all
-            self.repo_selection = [False] * len(self.repos)
+            for view in self.repo_views:
+                view.selected = False
 
         elif key == ord('k'):  # Select repos that need updates (smart selection)
             has_remote_updates = False
-            for i in range(len(self.repos)):
-                local_needs_update = self.repo_local_status[i] not in ["OK"]
-                remote_needs_update = self.repo_remote_status[i] not in ["Up to Date", "Not Checked"]
+            for view in self.repo_views:
+                local_needs_update = view.local.kind not in ["OK"]
+                remote_needs_update = view.remote.kind not in ["Up to Date", "Not Checked"]
                 if local_needs_update or remote_needs_update:
-                    self.repo_selection[i] = True
+                    view.selected = True
                     # Track if any selected repo has remote updates
                     if remote_needs_update:
                         has_remote_updates = True
                 else:
-                    self.repo_selection[i] = False
+                    view.selected = False
 
             # Smart action selection: sync if remote updates exist, otherwise push
             if has_remote_updates:
@@ -756,8 +1387,8 @@ class TUI:
 
         elif key == ord('f'):  # Fetch action
             self.action_selected = 1
-            self.refresh_remote_status()
-            self.draw()
+            invalidate_dir_cache()
+            self.refresh_remote_status(force_fetch=True)
 
         elif key == ord('l'):  # Pull action
             self.action_selected = 2
@@ -767,8 +1398,8 @@ class TUI:
 
         elif key == ord('t'):  # Status action
             self.action_selected = 4
+            invalidate_dir_cache()
             self.refresh_local_status()
-            self.draw()
 
         elif key == ord('n'):  # Untracked action
             self.action_selected = 5
@@ -776,15 +1407,29 @@ class TUI:
         elif key == ord('i'):  # Ignored action
             self.action_selected = 6
 
-        elif key == ord('r'):  # Refresh
+        elif key == ord('r'):  # Refresh (bypasses the FETCH_TTL window)
+            invalidate_dir_cache()
             self.refresh_local_status()
-            self.refresh_remote_status()
+            self.refresh_remote_status(force_fetch=True)
+
+        elif key == curses.KEY_RESIZE:
+            pass
+
+        else:
+            return  # Unbound key: nothing changed, skip the repaint
+
+        self.needs_redraw = True
 
     def execute_action(self):
         """Execute the selected action on selected repos"""
+        self.stop_background_refresh()
+
         # Properly end curses mode
         curses.endwin()
 
+        # Actions may clone repos; re-check directories from here on
+        invalidate_dir_cache()
+
         # Clear screen and show header
         os.system('clear')
         print(f"{Colors.BOLD}{Colors.CYAN}{'═' * 63}{Colors.RESET}")
@@ -794,7 +1439,7 @@ class TUI:
 
         work_dir = "." if self.workdir_selected == 0 else self.workdir_path
 
-        if not Path(work_dir).is_dir():
+        if not dir_exists(work_dir):
             error(f"Working directory does not exist: {work_dir}")
             print(f"\n{Colors.YELLOW}Press 'q' to quit or any other key to return to menu.{Colors.RESET}")
 
@@ -803,41 +1448,24 @@ class TUI:
                 self.running = False
                 return
 
-            # Reinitialize curses and return
-            self.stdscr = curses.initscr()
-            curses.curs_set(0)
-            if curses.has_colors():
-                curses.start_color()
-                curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
-                curses.init_pair(2, curses.COLOR_BLUE, curses.COLOR_BLACK)
-                curses.init_pair(3, curses.COLOR_GREEN, curses.COLOR_BLACK)
-                curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)
-                curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-                curses.init_pair(6, curses.COLOR_BLACK, curses.COLOR_CYAN)
-                curses.init_pair(7, curses.COLOR_BLACK, curses.COLOR_GREEN)
-
-            # Refresh status when returning to menu
-            self.status_message = "Refreshing repository statuses..."
-            self.draw()
-            self.refresh_local_status()
-            self.draw()  # Redraw without status message
+            self.resume_curses()
             return
 
         strategy = 'ours' if self.strategy_selected == 0 else 'theirs'
         action_names = ['sync', 'fetch', 'pull', 'push', 'status', 'untracked', 'ignored']
         action = action_names[self.action_selected]
 
-        selected_repos = [self.repos[i] for i in range(len(self.repos)) if self.repo_selection[i]]
+        selected_repos = [view.name for view in self.repo_views if view.selected]
 
         if not selected_repos:
             warn("No repositories selected. Nothing to do.")
         else:
-            for repo_name in selected_repos:
-                repo_url = ALL_REPOS.get(repo_name, '')
-                logs = process_repo(repo_name, repo_url, strategy, action, work_dir)
-                for log_msg in logs:
-                    print(log_msg)
-                print()
+            # Same ordered fan-out as run_cli_action, on the TUI's worker pool
+            results = self.pool.map(
+                lambda name: process_repo(name, ALL_REPOS.get(name, ''), strategy, action, work_dir),
+                selected_repos)
+            for logs in results:
+                sys.stdout.write("\n".join(logs) + "\n\n")
 
         print(f"\n{Colors.BOLD}{Colors.CYAN}{'═' * 63}{Colors.RESET}")
         print(f"{Colors.GREEN}{Colors.BOLD}                  All tasks complete!                          {Colors.RESET}")
@@ -850,114 +1478,114 @@ class TUI:
         if choice.lower() == 'q':
             self.running = False
         else:
-            # Reinitialize curses
-            self.stdscr = curses.initscr()
-            curses.curs_set(0)
-            if curses.has_colors():
-                curses.start_color()
-                curses.init_pair(1, curses.COLOR_CYAN, curses.COLOR_BLACK)
-                curses.init_pair(2, curses.COLOR_BLUE, curses.COLOR_BLACK)
-                curses.init_pair(3, curses.COLOR_GREEN, curses.COLOR_BLACK)
-                curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)
-                curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-                curses.init_pair(6, curses.COLOR_BLACK, curses.COLOR_CYAN)
-                curses.init_pair(7, curses.COLOR_BLACK, curses.COLOR_GREEN)
-
-            # Refresh status when returning to menu
-            self.status_message = "Refreshing repository statuses..."
-            self.draw()
-            self.refresh_local_status()
-            self.draw()  # Redraw without status message
+            self.resume_curses()
+
+    def resume_curses(self):
+        """Return to the menu after execute_action() left curses mode"""
+        # Restore the terminal modes saved in __init__; windows and color pairs survive endwin()
+        curses.reset_prog_mode()
+        curses.curs_set(0)
+        self.stdscr.clearok(True)  # The action's output replaced our screen; repaint all of it
+
+        # Refresh status when returning to menu
+        self.refresh_local_status()
+        self.start_background_remote_refresh()  # Repos the action fetched skip the network
+        self.draw()
 
     def run(self):
         """Main TUI loop"""
         while self.running:
-            self.draw()
+            # Only repaint after input or a background result changed something;
+            # clear the flag first so a result landing mid-draw isn't lost
+            with self.background_lock:
+                rows, self.background_rows = self.background_rows, set()
+            if self.needs_redraw:
+                self.needs_redraw = False
+                self.draw()
+            elif rows:
+                # Background results only touch their own rows and the progress line
+                rows.discard(None)
+                self.repaint_repo_rows(*rows, status_message=True)
             key = self.stdscr.getch()
             if key != -1:
                 self.handle_input(key)
 
 def run_tui(stdscr):
-    TUI(stdscr).run()
+    tui = TUI(stdscr)
+    try:
+        tui.run()
+    finally:
+        # Drop queued work and terminate in-flight fetches, so the pool threads the
+        # interpreter joins at exit finish at once instead of after NETWORK_TIMEOUT
+        tui.pool.shutdown(wait=False, cancel_futures=True)
+        tui.background_pool.shutdown(wait=False, cancel_futures=True)
+        stop_network_commands()
 
 # --- CLI Actions ---
-def run_cli_sync(strategy: str = 'remote', repos: Optional[List[str]] = None, work_dir: str = "."):
+def run_cli_action(action: str, repos: Optional[List[str]] = None, work_dir: str = ".",
+                   strategy: str = 'theirs', jobs: int = DEFAULT_JOBS):
+    """Run process_repo for each repo on a thread pool.
+
+    git releases the GIL while it waits on the network, so repos overlap.
+    process_repo already buffers its log lines, and map() yields in input
+    order, so each repo's block prints intact and in a stable order, as one
+    write rather than a line-buffered flush per line.
+    """
+    repos_to_process = repos if repos else ALL_REPO_NAMES
+    targets = [(name, ALL_REPOS[name]) for name in repos_to_process if ALL_REPOS.get(name)]
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = pool.map(
+            lambda t: process_repo(t[0], t[1], strategy, action, work_dir), targets)
+        for logs in results:
+            sys.stdout.write("\n".join(logs) + "\n\n")
+
+def run_cli_sync(strategy: str = 'remote', repos: Optional[List[str]] = None, work_dir: str = ".",
+                 jobs: int = DEFAULT_JOBS):
     git_strategy = 'ours' if strategy == 'local' else 'theirs'
     log(f"Starting Bidirectional Sync (Strategy: {git_strategy})")
-    repos_to_process = repos if repos else list(ALL_REPOS.keys())
-    for repo_name in repos_to_process:
-        repo_url = ALL_REPOS.get(repo_name, '')
-        if repo_url:
-            logs = process_repo(repo_name, repo_url, git_strategy, 'sync', work_dir)
-            for log_msg in logs:
-                print(log_msg)
-            print()
+    run_cli_action('sync', repos, work_dir, git_strategy, jobs)
 
-def run_cli_push(repos: Optional[List[str]] = None, work_dir: str = "."):
+def run_cli_push(repos: Optional[List[str]] = None, work_dir: str = ".", jobs: int = DEFAULT_JOBS):
     log("Starting Push")
-    repos_to_process = repos if repos else list(ALL_REPOS.keys())
-    for repo_name in repos_to_process:
-        repo_url = ALL_REPOS.get(repo_name, '')
-        if repo_url:
-            logs = process_repo(repo_name, repo_url, 'theirs', 'push', work_dir)
-            for log_msg in logs:
-                print(log_msg)
-            print()
+    run_cli_action('push', repos, work_dir, jobs=jobs)
 
-def run_cli_pull(repos: Optional[List[str]] = None, work_dir: str = "."):
+def run_cli_pull(repos: Optional[List[str]] = None, work_dir: str = ".", jobs: int = DEFAULT_JOBS):
     log("Starting Pull")
-    repos_to_process = repos if repos else list(ALL_REPOS.keys())
-    for repo_name in repos_to_process:
-        repo_url = ALL_REPOS.get(repo_name, '')
-        if repo_url:
-            logs = process_repo(repo_name, repo_url, 'theirs', 'pull', work_dir)
-            for log_msg in logs:
-                print(log_msg)
-            print()
+    run_cli_action('pull', repos, work_dir, jobs=jobs)
 
-def run_cli_status(repos: Optional[List[str]] = None, work_dir: str = "."):
+def run_cli_status(repos: Optional[List[str]] = None, work_dir: str = ".", jobs: int = DEFAULT_JOBS):
     log("Checking Status")
-    repos_to_process = repos if repos else list(ALL_REPOS.keys())
-    for repo_name in repos_to_process:
-        repo_url = ALL_REPOS.get(repo_name, '')
-        if repo_url:
-            logs = process_repo(repo_name, repo_url, 'theirs', 'status', work_dir)
-            for log_msg in logs:
-                print(log_msg)
-            print()
+    run_cli_action('status', repos, work_dir, jobs=jobs)
 
-def run_cli_untracked(repos: Optional[List[str]] = None, work_dir: str = "."):
+def run_cli_untracked(repos: Optional[List[str]] = None, work_dir: str = ".", jobs: int = DEFAULT_JOBS):
     log("Listing Untracked Files")
-    repos_to_process = repos if repos else list(ALL_REPOS.keys())
-    for repo_name in repos_to_process:
-        repo_url = ALL_REPOS.get(repo_name, '')
-        if repo_url:
-            logs = process_repo(repo_name, repo_url, 'theirs', 'untracked', work_dir)
-            for log_msg in logs:
-                print(log_msg)
-            print()
+    run_cli_action('untracked', repos, work_dir, jobs=jobs)
 
-def run_cli_ignored(repos: Optional[List[str]] = None, work_dir: str = "."):
+def run_cli_ignored(repos: Optional[List[str]] = None, work_dir: str = ".", jobs: int = DEFAULT_JOBS):
     log("Listing Ignored Files")
-    repos_to_process = repos if repos else list(ALL_REPOS.keys())
-    for repo_name in repos_to_process:
-        repo_url = ALL_REPOS.get(repo_name, '')
-        if repo_url:
-            logs = process_repo(repo_name, repo_url, 'theirs', 'ignored', work_dir)
-            for log_msg in logs:
-                print(log_msg)
-            print()
+    run_cli_action('ignored', repos, work_dir, jobs=jobs)
 
-def run_cli_fetch(repos: Optional[List[str]] = None, work_dir: str = "."):
+def run_cli_fetch(repos: Optional[List[str]] = None, work_dir: str = ".", jobs: int = DEFAULT_JOBS):
     log("Fetching")
-    repos_to_process = repos if repos else list(ALL_REPOS.keys())
-    for repo_name in repos_to_process:
-        repo_url = ALL_REPOS.get(repo_name, '')
-        if repo_url:
-            logs = process_repo(repo_name, repo_url, 'theirs', 'fetch', work_dir)
-            for log_msg in logs:
-                print(log_msg)
-            print()
+    run_cli_action('fetch', repos, work_dir, jobs=jobs)
+
+def run_cli_sync_command(repos: Optional[List[str]] = None, work_dir: str = ".", jobs: int = DEFAULT_JOBS):
+    """'sync [local|remote] [REPOS...]': split off the optional strategy, then sync"""
+    strategy = 'remote'
+    if repos and repos[0] in ('local', 'remote'):
+        strategy, repos = repos[0], repos[1:]
+    run_cli_sync(strategy, repos=repos or None, work_dir=work_dir, jobs=jobs)
+
+# CLI command name -> handler(repos=, work_dir=, jobs=)
+CLI_COMMANDS: Dict[str, Callable[..., None]] = {
+    'sync': run_cli_sync_command,
+    'push': run_cli_push,
+    'pull': run_cli_pull,
+    'status': run_cli_status,
+    'untracked': run_cli_untracked,
+    'ignored': run_cli_ignored,
+    'fetch': run_cli_fetch,
+}
 
 def print_help():
     """Print help message"""
@@ -968,6 +1596,7 @@ def print_help():
     print(f"{Colors.BOLD}{Colors.YELLOW}OPTIONS:{Colors.RESET}")
     print(f"  {Colors.GREEN}-w, --workdir PATH{Colors.RESET}\tSet working directory (default: /home/diego/Documents/Git)")
     print(f"  {Colors.GREEN}-c, --current{Colors.RESET}\t\tUse current directory as working directory")
+    print(f"  {Colors.GREEN}-j, --jobs N{Colors.RESET}\t\tRepos to process in parallel (default: {DEFAULT_JOBS}, 1 = serial)")
     print(f"  {Colors.GREEN}-h, --help{Colors.RESET}\t\tShow this help message\n")
     print(f"{Colors.BOLD}{Colors.YELLOW}COMMANDS:{Colors.RESET}")
     print(f"  (no command)\t\tLaunches the interactive TUI menu.")
@@ -992,45 +1621,100 @@ def print_help():
 
 def configure_safe_directories(work_dir: str):
     """Configure git safe.directory for the working directory and all repos"""
-    # Add the working directory itself
     work_dir_abs = str(Path(work_dir).absolute())
-    subprocess.run(['git', 'config', '--global', '--add', 'safe.directory', work_dir_abs],
-                   check=False, capture_output=True)
-
-    # Add wildcard for all subdirectories (repos)
-    safe_pattern = f"{work_dir_abs}/*"
-    subprocess.run(['git', 'config', '--global', '--add', 'safe.directory', safe_pattern],
-                   check=False, capture_output=True)
-
-    # Also add the universal wildcard as fallback
-    subprocess.run(['git', 'config', '--global', '--add', 'safe.directory', '*'],
-                   check=False, capture_output=True)
-
-def main():
-    """Main entry point for CLI and TUI"""
+    wanted = [
+        work_dir_abs,            # The working directory itself
+        f"{work_dir_abs}/*",     # Wildcard for all subdirectories (repos)
+        '*',                     # Universal wildcard as fallback
+    ]
+
+    # Read the current entries once and only add what is missing; '--add' on every
+    # run would keep appending duplicates that every later git call has to parse
+    result = subprocess.run([GIT_BIN, 'config', '--global', '--get-all', 'safe.directory'],
+                            check=False, capture_output=True, close_fds=False, env=get_git_env())
+    existing = set(decode_output(result.stdout).splitlines())
+    for entry in wanted:
+        if entry not in existing:
+            subprocess.run([GIT_BIN, 'config', '--global', '--add', 'safe.directory', entry],
+                           check=False, capture_output=True, close_fds=False, env=get_git_env())
+
+@dataclass
+class CliArgs:
+    """Parsed command line; same fields as the argparse namespace"""
+    workdir: str = DEFAULT_WORK_DIR
+    current: bool = False
+    jobs: int = DEFAULT_JOBS
+    help: bool = False
+    command: Optional[str] = None
+    args: List[str] = field(default_factory=list)
+
+def parse_args_fast(argv: List[str]) -> Optional[CliArgs]:
+    """Parse the usual command lines by hand so argparse is never imported for them
+
+    Returns None for anything else ('--opt=value', unknown options, a bad -j value);
+    main() then hands the command line to argparse to parse or report.
+    """
+    parsed = CliArgs()
+    positional = []
+    options = iter(argv)
+    for arg in options:
+        if arg in ('-c', '--current'):
+            parsed.current = True
+        elif arg in ('-h', '--help'):
+            parsed.help = True
+        elif arg in ('-w', '--workdir', '-j', '--jobs'):
+            value = next(options, None)
+            if value is None:
+                return None
+            if arg in ('-w', '--workdir'):
+                parsed.workdir = value
+            elif value.isdigit():
+                parsed.jobs = int(value)
+            else:
+                return None
+        elif arg.startswith('-'):
+            return None
+        else:
+            positional.append(arg)
+    if positional:
+        parsed.command, parsed.args = positional[0], positional[1:]
+    return parsed
+
+def parse_args_full():
+    """Parse sys.argv with argparse (only imported here), exiting on invalid arguments"""
+    import argparse
+    # Help is printed by print_help(); skip 3.14+'s per-argument colour checks
+    color_kwargs = {'color': False} if sys.version_info >= (3, 14) else {}
     parser = argparse.ArgumentParser(
         description='gcl.py - Git Clone/Pull/Push Manager',
         formatter_class=argparse.RawTextHelpFormatter,
         add_help=False,
-        exit_on_error=False
+        exit_on_error=False,
+        **color_kwargs
     )
-    parser.add_argument('-w', '--workdir', type=str, default='/home/diego/Documents/Git',
+    parser.add_argument('-w', '--workdir', type=str, default=DEFAULT_WORK_DIR,
                         help='Working directory for repositories')
     parser.add_argument('-c', '--current', action='store_true',
                         help='Use current directory as working directory')
+    parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_JOBS,
+                        help='Number of repos to process in parallel')
     parser.add_argument('-h', '--help', action='store_true',
                         help='Show help message')
     parser.add_argument('command', nargs='?', default=None, help='Command to execute')
     parser.add_argument('args', nargs='*', help='Additional arguments (strategy and/or repos)')
 
     try:
-        args = parser.parse_args()
+        return parser.parse_args()
     except argparse.ArgumentError as e:
         error(f"Invalid argument: {e}")
         print()
         print_help()
         sys.exit(1)
 
+def main():
+    """Main entry point for CLI and TUI"""
+    args = parse_args_fast(sys.argv[1:]) or parse_args_full()
+
     # Handle help
     if args.help:
         print_help()
@@ -1039,24 +1723,35 @@ def main():
     # Determine working directory
     work_dir = '.' if args.current else args.workdir
 
+    # Resolve the command before touching git config, so help and typos exit at once
+    cmd = args.command
+    if cmd is not None:
+        # Commands are typed in lower case; only fold when the exact lookup misses
+        if cmd not in CLI_COMMANDS and cmd != 'help':
+            cmd = cmd.lower()
+
+        # Handle help command
+        if cmd == 'help':
+            print_help()
+            sys.exit(0)
+
+        handler = CLI_COMMANDS.get(cmd)
+        if handler is None:
+            print(f"{Colors.RED}  ✗ Invalid command: {cmd}{Colors.RESET}", file=sys.stderr)
+            print("    Run 'gcl.py help' for usage.", file=sys.stderr)
+            sys.exit(1)
+
     # Configure safe directories automatically (silently)
     configure_safe_directories(work_dir)
 
     # If no command, launch TUI
-    if args.command is None:
+    if cmd is None:
         try:
             curses.wrapper(run_tui)
         except curses.error as e:
             error(f"Curses error: {e}")
         sys.exit(0)
 
-    cmd = args.command.lower()
-
-    # Handle help command
-    if cmd in ('help',):
-        print_help()
-        sys.exit(0)
-
     # Parse repos from args
     repos = args.args if args.args else None
 
@@ -1073,48 +1768,29 @@ def main():
             error(f"Invalid repository name(s): {', '.join(invalid_repos)}")
             print()
             print(f"{Colors.BOLD}{Colors.YELLOW}Available repositories:{Colors.RESET}")
-            for repo_name in sorted(ALL_REPOS.keys()):
+            for repo_name in REPOS_SORTED:
                 print(f"  - {repo_name}")
             print()
             print_help()
             sys.exit(1)
 
-    if cmd == 'sync':
-        strategy = 'remote'
-        if repos and repos[0] in ['local', 'remote']:
-            strategy = repos.pop(0)
-        run_cli_sync(strategy, repos=repos if repos else None, work_dir=work_dir)
-    elif cmd == 'push':
-        run_cli_push(repos=repos, work_dir=work_dir)
-    elif cmd == 'pull':
-        run_cli_pull(repos=repos, work_dir=work_dir)
-    elif cmd == 'status':
-        run_cli_status(repos=repos, work_dir=work_dir)
-    elif cmd == 'untracked':
-        run_cli_untracked(repos=repos, work_dir=work_dir)
-    elif cmd == 'ignored':
-        run_cli_ignored(repos=repos, work_dir=work_dir)
-    elif cmd == 'fetch':
-        run_cli_fetch(repos=repos, work_dir=work_dir)
-    else:
-        error(f"Invalid command: {cmd}")
-        print()
-        print_help()
-        sys.exit(1)
+    handler(repos=repos, work_dir=work_dir, jobs=args.jobs)
 
 
 def is_git_installed():
-    """Check if git is installed"""
-    try:
-        subprocess.run(['git', '--version'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if git is installed (a PATH lookup; no 'git --version' spawn on startup)"""
+    return shutil.which(GIT_BIN) is not None
 
-if __name__ == "__main__":
+def entry_point():
+    """Run gcl, reporting a missing git, Ctrl-C and crashes
+
+    Launchers call this via 'import gcl' so the bytecode is cached in __pycache__;
+    running gcl.py as a script recompiles the whole file on every start.
+    """
     try:
         if not is_git_installed():
-            print(f"{Colors.RED}Error: 'git' command not found. Please install Git and ensure it's in your PATH.{Colors.RESET}")
+            print(f"{Colors.RED}Error: 'git' command not found.{Colors.RESET}", file=sys.stderr)
+            print("Please install Git and ensure it's in your PATH.", file=sys.stderr)
             sys.exit(1)
         main()
     except KeyboardInterrupt:
@@ -1123,4 +1799,7 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"{Colors.RED}Application crashed unexpectedly: {e}{Colors.RESET}")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    entry_point()
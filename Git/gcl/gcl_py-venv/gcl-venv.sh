@@ -121,13 +121,13 @@ run_gcl() {
         exit 1
     fi
 
-    # Activate venv and run gcl.py
-    source "$SCRIPT_DIR/$VENV_DIR/bin/activate"
-    python3 "$SCRIPT_DIR/../gcl.py" "$@"
-    RESULT=$?
-    deactivate
-
-    exit $RESULT
+    # The venv's interpreter needs no activation; exec hands it this process
+    # so no bash stays resident and the exit code is gcl.py's own
+    # Importing gcl (rather than running gcl.py) reuses its cached bytecode;
+    # -P keeps the current directory (the Git workdir) off the module search path
+    exec "$SCRIPT_DIR/$VENV_DIR/bin/python3" -P -c \
+        'import sys; sys.argv[0] = "gcl"; sys.path.insert(0, sys.argv.pop(1)); import gcl; gcl.entry_point()' \
+        "$SCRIPT_DIR/.." "$@"
 }
 
 # Show interactive menu
@@ -24,8 +24,8 @@ if [ ! -d "$REPO_PATH" ]; then
     exit 1
 fi
 
-# Find all 0.spec folders
-find "$REPO_PATH" -type d -name "0.spec" | while read -r spec_dir; do
+# Find all 0.spec folders (skip .git, nothing to restore in object storage)
+find "$REPO_PATH" -name .git -prune -o -type d -name "0.spec" -print | while read -r spec_dir; do
     _log "Processing: $spec_dir"
 
     # Check each specified file